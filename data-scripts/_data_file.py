@@ -0,0 +1,25 @@
+"""
+Writer for the `data` file read by `--walk-type data_walk`, shared by the
+generate_*.py scripts.
+"""
+
+# Rows formatted per write; bounds the text held in memory at once
+_CHUNK_ROWS = 4096
+
+_ROW_FORMAT = '%.6f,%.6f,%.6f\n'
+
+def write_coordinates(path, coordinates):
+    """
+    Write coordinates to `path` as comma-separated x,y,z lines.
+
+    Each chunk of rows is formatted in a single printf-style pass, which
+    is several times faster than formatting row by row.
+
+    Args:
+        path: Output filename
+        coordinates: Array of shape (steps, 3)
+    """
+    with open(path, 'w') as f:
+        for start in range(0, len(coordinates), _CHUNK_ROWS):
+            chunk = coordinates[start:start + _CHUNK_ROWS]
+            f.write((_ROW_FORMAT * len(chunk)) % tuple(chunk.ravel().tolist()))
@@ -0,0 +1,31 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the Lorenz integrator, used by generate_lorenz.py when it
+has been compiled. Build it in place from the data-scripts folder with:
+
+    cythonize -i _lorenz.pyx
+"""
+
+def lorenz_core(Py_ssize_t steps, double dt, double sigma, double rho,
+                double beta, double scale, double[:, ::1] out):
+    """Integrate the Lorenz system with Euler steps, writing into `out`."""
+    # Initial conditions (slightly off from origin to start the chaos)
+    cdef double x = 0.1, y = 0.0, z = 0.0
+    cdef double dx_dt, dy_dt, dz_dt
+    cdef Py_ssize_t i
+
+    for i in range(steps):
+        # Store current position (scaled)
+        out[i, 0] = x * scale
+        out[i, 1] = y * scale
+        out[i, 2] = z * scale
+
+        # Compute derivatives
+        dx_dt = sigma * (y - x)
+        dy_dt = x * (rho - z) - y
+        dz_dt = x * y - beta * z
+
+        # Euler integration step
+        x += dx_dt * dt
+        y += dy_dt * dt
+        z += dz_dt * dt
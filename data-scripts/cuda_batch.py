@@ -0,0 +1,207 @@
+"""
+Generate many Lissajous curves, torus knots or spiral spheres at once on a
+CUDA GPU, for sweeping their parameters.
+
+Each curve uses the same equations as the matching generate_*.py script, with
+one GPU thread per (curve, step) pair. Set NUMBA_ENABLE_CUDASIM=1 to run the
+kernels on Numba's CPU simulator when no GPU is available.
+
+Example:
+    from cuda_batch import generate_torus_knot_batch
+    knots = generate_torus_knot_batch(p=[3, 5, 7], q=2)  # shape (3, 25000, 3)
+"""
+
+import math
+
+import numpy as np
+from numba import cuda
+
+# Threads per CUDA block; the grid covers every (curve, step) pair in a
+# single dimension, so the number of curves is not capped by grid.y
+_CUDA_THREADS = 256
+
+def _per_curve(*values):
+    """
+    Broadcast scalar or 1-D per-curve parameters against each other.
+
+    Raises:
+        ValueError: If a parameter has more than one dimension
+    """
+    arrays = [np.atleast_1d(value) for value in values]
+    if any(array.ndim != 1 for array in arrays):
+        raise ValueError("Batch parameters must be scalars or 1-D arrays")
+
+    return np.broadcast_arrays(*arrays)
+
+def _check_steps(steps):
+    """
+    Check that every curve of a batch gets at least one step.
+
+    Raises:
+        ValueError: If steps is not a positive integer
+    """
+    if steps <= 0:
+        raise ValueError("steps must be a positive integer")
+
+def _as_frequencies(*params):
+    """
+    Convert per-curve frequency parameters to int64 arrays.
+
+    Raises:
+        ValueError: If a frequency is not an integer
+    """
+    if any(not np.issubdtype(param.dtype, np.integer) for param in params):
+        raise ValueError("Frequencies must be integers")
+
+    return [param.astype(np.int64) for param in params]
+
+def _launch(kernel, curves, steps, *args):
+    """Run `kernel` over a (curves, steps, 3) output and copy it back."""
+    out = cuda.device_array((curves, steps, 3), dtype=np.float64)
+    blocks = (curves * steps + _CUDA_THREADS - 1) // _CUDA_THREADS
+    kernel[blocks, _CUDA_THREADS](out, *args)
+
+    return out.copy_to_host()
+
+@cuda.jit
+def _lissajous_batch_kernel(out, angle_steps, phases, amps):
+    """Evaluate one step of one curve per GPU thread, writing into `out`."""
+    # Steps vary fastest so neighbouring threads write neighbouring points
+    k = cuda.grid(1)
+    steps = out.shape[1]
+    curve = k // steps
+    i = k % steps
+    if curve < out.shape[0]:
+        for axis in range(3):
+            out[curve, i, axis] = amps[curve, axis] * math.sin(
+                angle_steps[curve, axis] * i + phases[curve, axis])
+
+@cuda.jit
+def _torus_knot_batch_kernel(out, p_dt, q_dt, R, r):
+    """Evaluate one step of one knot per GPU thread, writing into `out`."""
+    # Steps vary fastest so neighbouring threads write neighbouring points
+    k = cuda.grid(1)
+    steps = out.shape[1]
+    knot = k // steps
+    i = k % steps
+    if knot < out.shape[0]:
+        pt = p_dt[knot] * i
+        qt = q_dt[knot] * i
+
+        # Torus knot parametric equations; cos(p·t) is shared by x and y
+        tube = R[knot] + r[knot] * math.cos(pt)
+        out[knot, i, 0] = tube * math.cos(qt)
+        out[knot, i, 1] = tube * math.sin(qt)
+        out[knot, i, 2] = r[knot] * math.sin(pt)
+
+@cuda.jit
+def _spiral_batch_kernel(out, radius, turns):
+    """Evaluate one step of one spiral per GPU thread, writing into `out`."""
+    # Steps vary fastest so neighbouring threads write neighbouring points
+    k = cuda.grid(1)
+    steps = out.shape[1]
+    curve = k // steps
+    i = k % steps
+    if curve < out.shape[0]:
+        y = -radius[curve] + i * (2 * radius[curve]) / steps
+        y_radius = math.sqrt(radius[curve] * radius[curve] - y * y)
+        turn_angle = i * (turns[curve] * 2 * math.pi / steps)
+
+        out[curve, i, 0] = math.cos(turn_angle) * y_radius
+        out[curve, i, 1] = y
+        out[curve, i, 2] = math.sin(turn_angle) * y_radius
+
+def generate_lissajous_batch(a, b, c,
+                             phase_x=0.0, phase_y=math.pi/2, phase_z=0.0,
+                             amp_x=100.0, amp_y=100.0, amp_z=100.0,
+                             steps=25000):
+    """
+    Generate many 3D Lissajous curves at once on a CUDA GPU.
+
+    Every argument except steps takes either a scalar or a 1-D array with
+    one value per curve; they are broadcast against each other.
+
+    Args:
+        a, b, c: Frequency ratios for x, y, z axes
+        phase_x, phase_y, phase_z: Phase shifts in radians
+        amp_x, amp_y, amp_z: Amplitudes (scale) for each axis
+        steps: Number of points to generate per curve
+
+    Returns:
+        NumPy array of shape (curves, steps, 3) holding the coordinates
+
+    Raises:
+        ValueError: If a parameter has more than one dimension, a
+            frequency is not an integer, or steps is not positive
+    """
+    _check_steps(steps)
+    params = _per_curve(a, b, c, phase_x, phase_y, phase_z,
+                        amp_x, amp_y, amp_z)
+    a, b, c = _as_frequencies(*params[:3])
+
+    # Same period and per-step angle as generate_lissajous, per curve
+    dt = 2 * math.pi * np.lcm(np.lcm(a, b), c) / steps
+    angle_steps = np.column_stack((a * dt, b * dt, c * dt))
+    phases = np.column_stack(params[3:6]).astype(np.float64)
+    amps = np.column_stack(params[6:]).astype(np.float64)
+
+    return _launch(_lissajous_batch_kernel, len(angle_steps), steps,
+                   angle_steps, phases, amps)
+
+def generate_torus_knot_batch(p, q, R=100.0, r=50.0, steps=25000):
+    """
+    Generate many torus knots at once on a CUDA GPU.
+
+    Every argument except steps takes either a scalar or a 1-D array with
+    one value per knot; they are broadcast against each other.
+
+    Args:
+        p: Number of times the knot winds around the torus longitudinally
+        q: Number of times the knot winds around the torus meridionally
+        R: Major radius (distance from center to tube center)
+        r: Minor radius (tube thickness)
+        steps: Number of points to generate per knot
+
+    Returns:
+        NumPy array of shape (knots, steps, 3) holding the coordinates
+
+    Raises:
+        ValueError: If a parameter has more than one dimension, p or q
+            is not an integer, or steps is not positive
+    """
+    _check_steps(steps)
+    p, q, R, r = _per_curve(p, q, R, r)
+    p, q = _as_frequencies(p, q)
+
+    # Same t_max and per-step angles as generate_torus_knot, per knot
+    dt = 2 * math.pi * np.maximum(p, q) / steps
+    p_dt = (p * dt).astype(np.float64)
+    q_dt = (q * dt).astype(np.float64)
+
+    return _launch(_torus_knot_batch_kernel, len(p_dt), steps,
+                   p_dt, q_dt, R.astype(np.float64), r.astype(np.float64))
+
+def spiral_batch(steps, radius, turns):
+    """
+    Generate many spiral spheres at once on a CUDA GPU.
+
+    radius and turns each take either a scalar or a 1-D array with one
+    value per spiral; they are broadcast against each other.
+
+    Args:
+        steps: Number of points to generate per spiral
+        radius: Radius of the sphere the spiral winds around
+        turns: Number of full turns from the bottom to the top
+
+    Returns:
+        NumPy array of shape (spirals, steps, 3) holding the coordinates
+
+    Raises:
+        ValueError: If a parameter has more than one dimension, or steps
+            is not positive
+    """
+    _check_steps(steps)
+    radius, turns = _per_curve(radius, turns)
+
+    return _launch(_spiral_batch_kernel, len(radius), steps,
+                   radius.astype(np.float64), turns.astype(np.float64))
@@ -19,6 +19,32 @@ Where:
 import argparse
 import math
 
+import numpy as np
+
+from _data_file import write_coordinates
+
+# How far, in steps, a phase offset may be from a whole number of steps and
+# still be applied as a shift of an already evaluated wave
+_PHASE_SHIFT_TOLERANCE = 1e-6
+
+def _lissajous_axis(i, angle_step, phase, amp, out=None):
+    """Evaluate one axis of the Lissajous equations at the steps in `i`."""
+    # The angle is angle_step * i rather than a running sum, so rounding
+    # errors do not build up along the curve
+    wave = np.sin(angle_step * i + phase)
+    return np.multiply(wave, amp, out=out)
+
+def _lissajous_wave(steps, cycles, angle_step, phase):
+    """Evaluate a unit sine wave making `cycles` full turns over `steps`."""
+    # When the cycles divide the steps evenly every cycle is sampled at the
+    # same angles, so evaluate a single cycle and repeat it
+    if steps % cycles == 0:
+        cycle = np.arange(steps // cycles, dtype=np.int64)
+        return np.tile(_lissajous_axis(cycle, angle_step, phase, 1.0), cycles)
+
+    i = np.arange(steps, dtype=np.int64)
+    return _lissajous_axis(i, angle_step, phase, 1.0)
+
 def generate_lissajous(a=3, b=4, c=5,
                        phase_x=0.0, phase_y=math.pi/2, phase_z=0.0,
                        amp_x=100.0, amp_y=100.0, amp_z=100.0,
@@ -33,28 +59,54 @@ def generate_lissajous(a=3, b=4, c=5,
         steps: Number of points to generate
 
     Returns:
-        List of (x, y, z) tuples
+        NumPy array of shape (steps, 3) holding the x, y, z coordinates
     """
-    coordinates = []
-
     # Calculate period to complete the curve
     # LCM of frequencies determines when curve closes
-    from math import gcd
-    def lcm(a, b):
-        return abs(a * b) // gcd(a, b)
-
-    period = lcm(lcm(a, b), c)
+    period = math.lcm(a, b, c)
     t_max = 2 * math.pi * period
 
-    for i in range(steps):
-        t = (i / steps) * t_max
-
-        # Lissajous parametric equations
-        x = amp_x * math.sin(a * t + phase_x)
-        y = amp_y * math.sin(b * t + phase_y)
-        z = amp_z * math.sin(c * t + phase_z)
-
-        coordinates.append((x, y, z))
+    # Angle advanced per step on each axis
+    dt = t_max / steps
+
+    # Axes sharing a frequency only differ in amplitude and phase, so group
+    # them to evaluate each distinct sine wave once
+    waves = {}
+    axes = ((a, phase_x, amp_x), (b, phase_y, amp_y), (c, phase_z, amp_z))
+    for column, (freq, phase, amp) in enumerate(axes):
+        waves.setdefault(freq, []).append((column, phase, amp))
+
+    # Evaluate the same axis kernel for x, y and z, writing straight into
+    # the columns of the output array
+    i = np.arange(steps, dtype=np.int64)
+    coordinates = np.empty((steps, 3), dtype=np.float64)
+    for freq, columns in waves.items():
+        angle_step = freq * dt
+        # Over all steps the axis makes a whole number of full cycles
+        cycles = freq * period
+
+        # Zero or negative frequencies make no forward cycles to shift or
+        # repeat, so those axes are always evaluated directly
+        if cycles <= 0 or (len(columns) == 1 and steps % cycles):
+            for column, phase, amp in columns:
+                _lissajous_axis(i, angle_step, phase, amp,
+                                out=coordinates[:, column])
+            continue
+
+        # A phase offset that is a whole number of steps is just a shift of
+        # the first axis' wave, because that wave wraps around exactly
+        base_phase = columns[0][1]
+        wave = _lissajous_wave(steps, cycles, angle_step, base_phase)
+        for column, phase, amp in columns:
+            shift = (phase - base_phase) / angle_step
+            # A non-finite phase has no whole-step shift to apply
+            if math.isfinite(shift) and math.isclose(
+                    shift, round(shift), abs_tol=_PHASE_SHIFT_TOLERANCE):
+                np.multiply(np.roll(wave, -round(shift)), amp,
+                            out=coordinates[:, column])
+            else:
+                _lissajous_axis(i, angle_step, phase, amp,
+                                out=coordinates[:, column])
 
     return coordinates
 
@@ -143,6 +195,10 @@ Phase shifts (in radians):
     if args.a <= 0 or args.b <= 0 or args.c <= 0:
         parser.error("Frequencies (a, b, c) must be positive integers")
 
+    # Validate steps is positive (the per-step angle divides by it)
+    if args.steps <= 0:
+        parser.error("steps must be a positive integer")
+
     print(f"Generating 3D Lissajous Curve ({args.a}:{args.b}:{args.c})...")
     print(f"  Frequencies: a={args.a}, b={args.b}, c={args.c}")
     print(f"  Phases: δx={args.phase_x:.4f}, δy={args.phase_y:.4f}, δz={args.phase_z:.4f}")
@@ -158,9 +214,7 @@ Phase shifts (in radians):
     )
 
     # Write to file
-    with open(args.output, 'w') as f:
-        for x, y, z in coordinates:
-            f.write(f"{x:.6f},{y:.6f},{z:.6f}\n")
+    write_coordinates(args.output, coordinates)
 
     print(f"Generated {len(coordinates)} coordinates")
     print(f"Saved to '{args.output}'")
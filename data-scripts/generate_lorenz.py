@@ -10,6 +10,43 @@ The Lorenz system is a set of differential equations that exhibit chaotic behavi
 Classic parameters: σ=10, ρ=28, β=8/3
 """
 
+import sys
+
+import numpy as np
+
+from _data_file import write_coordinates
+
+def _lorenz_core(steps, dt, sigma, rho, beta, scale, out):
+    """Integrate the Lorenz system with Euler steps, writing into `out`."""
+    # Initial conditions (slightly off from origin to start the chaos)
+    x, y, z = 0.1, 0.0, 0.0
+
+    for i in range(steps):
+        # Store current position (scaled)
+        out[i, 0] = x * scale
+        out[i, 1] = y * scale
+        out[i, 2] = z * scale
+
+        # Compute derivatives
+        dx_dt = sigma * (y - x)
+        dy_dt = x * (rho - z) - y
+        dz_dt = x * y - beta * z
+
+        # Euler integration step
+        x += dx_dt * dt
+        y += dy_dt * dt
+        z += dz_dt * dt
+
+# Use the Cython build of _lorenz.pyx if it has been compiled, and run the
+# integrator as plain Python otherwise. The prebuilt extension is imported
+# directly: compiling or loading it through pyximport would cost more than
+# the whole 25,000-step integration
+try:
+    from _lorenz import lorenz_core as _lorenz_core
+except ImportError:
+    print("_lorenz extension not built, using the pure-Python integrator",
+          file=sys.stderr)
+
 def lorenz_attractor(steps=25000, dt=0.01):
     """
     Generate Lorenz attractor coordinates using Euler method.
@@ -19,34 +56,18 @@ def lorenz_attractor(steps=25000, dt=0.01):
         dt: Time step for numerical integration
 
     Returns:
-        List of (x, y, z) tuples
+        NumPy array of shape (steps, 3) holding the x, y, z coordinates
     """
     # Lorenz parameters (classic values)
     sigma = 10.0
     rho = 28.0
     beta = 8.0 / 3.0
 
-    # Initial conditions (slightly off from origin to start the chaos)
-    x, y, z = 0.1, 0.0, 0.0
-
-    coordinates = []
-
     # Scale factor to make the attractor fit nicely in view
     scale = 10.0
 
-    for _ in range(steps):
-        # Store current position (scaled)
-        coordinates.append((x * scale, y * scale, z * scale))
-
-        # Compute derivatives
-        dx_dt = sigma * (y - x)
-        dy_dt = x * (rho - z) - y
-        dz_dt = x * y - beta * z
-
-        # Euler integration step
-        x += dx_dt * dt
-        y += dy_dt * dt
-        z += dz_dt * dt
+    coordinates = np.empty((steps, 3), dtype=np.float64)
+    _lorenz_core(steps, dt, sigma, rho, beta, scale, coordinates)
 
     return coordinates
 
@@ -57,9 +78,7 @@ def main():
     coordinates = lorenz_attractor(steps=25000, dt=0.01)
 
     # Write to data file
-    with open('data', 'w') as f:
-        for x, y, z in coordinates:
-            f.write(f"{x:.6f},{y:.6f},{z:.6f}\n")
+    write_coordinates('data', coordinates)
 
     print(f"Generated {len(coordinates)} coordinates")
     print("Saved to 'data' file")
@@ -2,32 +2,29 @@
 
 import math
 
+import numpy as np
+
+from _data_file import write_coordinates
+
 def spiral(steps, radius, turns):
-    coordinates = []
+    coordinates = np.empty((steps, 3), dtype=np.float64)
 
-    y = -radius
-    y_step = (2 * radius) / steps
-    
-    turn_angle = 0
-    turn_angle_step = turns * 2 * math.pi / steps
+    y = np.linspace(-radius, radius, steps, endpoint=False)
+    y_radius = np.sqrt(radius * radius - y * y)
 
-    for i in range(steps):
-        y_radius = math.sqrt(radius * radius - y * y)
-        x = math.cos(turn_angle) * y_radius
-        z = math.sin(turn_angle) * y_radius
+    turn_angle_step = turns * 2 * math.pi / steps
+    turn_angle = np.arange(steps) * turn_angle_step
 
-        coordinates.append((x, y, z))
-        y += y_step
-        turn_angle += turn_angle_step
+    coordinates[:, 0] = np.cos(turn_angle) * y_radius
+    coordinates[:, 1] = y
+    coordinates[:, 2] = np.sin(turn_angle) * y_radius
 
     return coordinates
 
 def main():
     coordinates = spiral(steps=25000, radius=200, turns=30)
 
-    with open('data', 'w') as f:
-        for x, y, z in coordinates:
-            f.write(f"{x:.6f},{y:.6f},{z:.6f}\n")
+    write_coordinates('data', coordinates)
 
     print(f"Generated {len(coordinates)} coordinates")
 
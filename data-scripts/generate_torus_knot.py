@@ -19,6 +19,10 @@ Parametric equations:
 import argparse
 import math
 
+import numpy as np
+
+from _data_file import write_coordinates
+
 def generate_torus_knot(p=3, q=2, R=100.0, r=50.0, steps=25000):
     """
     Generate torus knot coordinates.
@@ -31,23 +35,37 @@ def generate_torus_knot(p=3, q=2, R=100.0, r=50.0, steps=25000):
         steps: Number of points to generate
 
     Returns:
-        List of (x, y, z) tuples
+        NumPy array of shape (steps, 3) holding the x, y, z coordinates
     """
-    coordinates = []
-
     # Parameter t goes from 0 to 2π·lcm(p,q)/q to complete the knot
     # For simplicity, we'll use a multiple of 2π that ensures completion
     t_max = 2 * math.pi * max(p, q)
 
-    for i in range(steps):
-        t = (i / steps) * t_max
-
-        # Torus knot parametric equations
-        x = (R + r * math.cos(p * t)) * math.cos(q * t)
-        y = (R + r * math.cos(p * t)) * math.sin(q * t)
-        z = r * math.sin(p * t)
-
-        coordinates.append((x, y, z))
+    # Angle advanced per step for each winding, applied to every step index
+    dt = t_max / steps
+    i = np.arange(steps)
+    pt = (p * dt) * i
+
+    # Each angle feeds both a cos and a sin, and each trig term is shared
+    # between the equations, so evaluate every one of them only once
+    cp = np.cos(pt)
+    sp = np.sin(pt)
+
+    # With p == q both windings share their angle, so reuse its trig
+    if p == q:
+        cq = cp
+        sq = sp
+    else:
+        qt = (q * dt) * i
+        cq = np.cos(qt)
+        sq = np.sin(qt)
+
+    # Torus knot parametric equations
+    coordinates = np.empty((steps, 3), dtype=np.float64)
+    tube = R + r * cp
+    coordinates[:, 0] = tube * cq
+    coordinates[:, 1] = tube * sq
+    coordinates[:, 2] = r * sp
 
     return coordinates
 
@@ -101,6 +119,10 @@ Popular knot types:
     if args.p <= 0 or args.q <= 0:
         parser.error("p and q must be positive integers")
 
+    # Validate steps is positive (the per-step angle divides by it)
+    if args.steps <= 0:
+        parser.error("steps must be a positive integer")
+
     print(f"Generating ({args.p},{args.q}) Torus Knot...")
     print(f"  Major radius (R): {args.R}")
     print(f"  Minor radius (r): {args.r}")
@@ -116,9 +138,7 @@ Popular knot types:
     )
 
     # Write to file
-    with open(args.output, 'w') as f:
-        for x, y, z in coordinates:
-            f.write(f"{x:.6f},{y:.6f},{z:.6f}\n")
+    write_coordinates(args.output, coordinates)
 
     print(f"Generated {len(coordinates)} coordinates")
     print(f"Saved to '{args.output}'")